@@ -2,7 +2,6 @@
 SQLAlchemy implementation of the WorkflowNodeExecutionRepository.
 """
 
-import json
 import logging
 from collections.abc import Sequence
 from typing import Optional, Union
@@ -21,6 +20,7 @@ from core.workflow.nodes.enums import NodeType
 from core.workflow.repositories.workflow_node_execution_repository import OrderConfig, WorkflowNodeExecutionRepository
 from core.workflow.workflow_type_encoder import WorkflowRuntimeTypeConverter
 from libs.helper import extract_tenant_id
+from libs.orjson import orjson_dumps_with_fallback
 from models import (
     Account,
     CreatorUserRole,
@@ -90,6 +90,9 @@ class SQLAlchemyWorkflowNodeExecutionRepository(WorkflowNodeExecutionRepository)
         # Key: node_execution_id, Value: WorkflowNodeExecution (DB model)
         self._node_execution_cache: dict[str, WorkflowNodeExecutionModel] = {}
 
+        # The converter is stateless, so a single instance is shared by all `to_db_model` calls.
+        self._json_converter = WorkflowRuntimeTypeConverter()
+
     def _to_domain_model(self, db_model: WorkflowNodeExecutionModel) -> WorkflowNodeExecution:
         """
         Convert a database model to a domain model.
@@ -148,7 +151,6 @@ class SQLAlchemyWorkflowNodeExecutionRepository(WorkflowNodeExecutionRepository)
         if not self._creator_user_role:
             raise ValueError("created_by_role is required in repository constructor")
 
-        json_converter = WorkflowRuntimeTypeConverter()
         db_model = WorkflowNodeExecutionModel()
         db_model.id = domain_model.id
         db_model.tenant_id = self._tenant_id
@@ -164,21 +166,25 @@ class SQLAlchemyWorkflowNodeExecutionRepository(WorkflowNodeExecutionRepository)
         db_model.node_type = domain_model.node_type
         db_model.title = domain_model.title
         db_model.inputs = (
-            json.dumps(json_converter.to_json_encodable(domain_model.inputs)) if domain_model.inputs else None
+            orjson_dumps_with_fallback(self._json_converter.to_json_encodable(domain_model.inputs))
+            if domain_model.inputs
+            else None
         )
         db_model.process_data = (
-            json.dumps(json_converter.to_json_encodable(domain_model.process_data))
+            orjson_dumps_with_fallback(self._json_converter.to_json_encodable(domain_model.process_data))
             if domain_model.process_data
             else None
         )
         db_model.outputs = (
-            json.dumps(json_converter.to_json_encodable(domain_model.outputs)) if domain_model.outputs else None
+            orjson_dumps_with_fallback(self._json_converter.to_json_encodable(domain_model.outputs))
+            if domain_model.outputs
+            else None
         )
         db_model.status = domain_model.status
         db_model.error = domain_model.error
         db_model.elapsed_time = domain_model.elapsed_time
         db_model.execution_metadata = (
-            json.dumps(jsonable_encoder(domain_model.metadata)) if domain_model.metadata else None
+            orjson_dumps_with_fallback(jsonable_encoder(domain_model.metadata)) if domain_model.metadata else None
         )
         db_model.created_at = domain_model.created_at
         db_model.created_by_role = self._creator_user_role
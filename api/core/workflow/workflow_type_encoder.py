@@ -7,6 +7,10 @@ from pydantic import BaseModel
 from core.file.models import File
 from core.variables import Segment
 
+# Leaf types that are already JSON encodable and returned unchanged.
+# Checked with `type(value) in ...` so the common leaves skip the `isinstance` chain below.
+_JSON_PRIMITIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 
 class WorkflowRuntimeTypeConverter:
     def to_json_encodable(self, value: Mapping[str, Any] | None) -> Mapping[str, Any] | None:
@@ -14,8 +18,15 @@ class WorkflowRuntimeTypeConverter:
         return result if isinstance(result, Mapping) or result is None else dict(result)
 
     def _to_json_encodable_recursive(self, value: Any) -> Any:
-        if value is None:
+        value_type = type(value)
+        if value_type in _JSON_PRIMITIVE_TYPES:
             return value
+        # Plain dicts and lists are the most common containers, match them by exact type
+        # before the comparatively slow `isinstance` checks against pydantic models below.
+        if value_type is dict:
+            return self._dict_to_json_encodable(value)
+        if value_type is list:
+            return self._list_to_json_encodable(value)
         if isinstance(value, (bool, int, str, float)):
             return value
         if isinstance(value, Decimal):
@@ -28,13 +39,19 @@ class WorkflowRuntimeTypeConverter:
         if isinstance(value, BaseModel):
             return value.model_dump(mode="json")
         if isinstance(value, dict):
-            res = {}
-            for k, v in value.items():
-                res[k] = self._to_json_encodable_recursive(v)
-            return res
+            return self._dict_to_json_encodable(value)
         if isinstance(value, list):
-            res_list = []
-            for item in value:
-                res_list.append(self._to_json_encodable_recursive(item))
-            return res_list
+            return self._list_to_json_encodable(value)
         return value
+
+    def _dict_to_json_encodable(self, value: dict) -> dict:
+        res = {}
+        for k, v in value.items():
+            res[k] = self._to_json_encodable_recursive(v)
+        return res
+
+    def _list_to_json_encodable(self, value: list) -> list:
+        res_list = []
+        for item in value:
+            res_list.append(self._to_json_encodable_recursive(item))
+        return res_list
@@ -1,3 +1,5 @@
+import json
+import math
 from typing import Any, Optional
 
 import orjson
@@ -9,3 +11,28 @@ def orjson_dumps(
     option: Optional[int] = None,
 ) -> str:
     return orjson.dumps(obj, option=option).decode(encoding)
+
+
+def orjson_dumps_with_fallback(obj: Any) -> str:
+    """
+    Serialize `obj` to a compact JSON string with orjson, stringifying non-string keys.
+
+    Values orjson refuses to encode, such as integers exceeding 64 bits or strings
+    containing lone surrogates, fall back to `json.dumps` with ASCII escaping.
+    Both paths encode `NaN` and `Infinity` as `null` and use the same separators.
+    """
+    try:
+        return orjson_dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    except orjson.JSONEncodeError:
+        return json.dumps(_replace_non_finite_floats(obj), separators=(",", ":"), allow_nan=False)
+
+
+def _replace_non_finite_floats(obj: Any) -> Any:
+    # Mirror orjson, which encodes `NaN` and `Infinity` as `null`.
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {k: _replace_non_finite_floats(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_non_finite_floats(v) for v in obj]
+    return obj
@@ -765,11 +765,13 @@ class WorkflowNodeExecutionModel(Base):
         from core.tools.tool_manager import ToolManager
 
         extras = {}
-        if self.execution_metadata_dict:
+        # Decode `execution_metadata` once, `execution_metadata_dict` parses the JSON on every access.
+        execution_metadata = self.execution_metadata_dict
+        if execution_metadata:
             from core.workflow.nodes import NodeType
 
-            if self.node_type == NodeType.TOOL.value and "tool_info" in self.execution_metadata_dict:
-                tool_info = self.execution_metadata_dict["tool_info"]
+            if self.node_type == NodeType.TOOL.value and "tool_info" in execution_metadata:
+                tool_info = execution_metadata["tool_info"]
                 extras["icon"] = ToolManager.get_tool_icon(
                     tenant_id=self.tenant_id,
                     provider_type=tool_info["provider_type"],
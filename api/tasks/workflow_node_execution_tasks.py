@@ -5,7 +5,6 @@ These tasks provide asynchronous storage capabilities for workflow node executio
 improving performance by offloading storage operations to background workers.
 """
 
-import json
 import logging
 
 from celery import shared_task
@@ -17,6 +16,7 @@ from core.workflow.entities.workflow_node_execution import (
 )
 from core.workflow.workflow_type_encoder import WorkflowRuntimeTypeConverter
 from extensions.ext_database import db
+from libs.orjson import orjson_dumps_with_fallback
 from models import CreatorUserRole, WorkflowNodeExecutionModel
 from models.workflow import WorkflowNodeExecutionTriggeredFrom
 
@@ -113,19 +113,25 @@ def _create_node_execution_from_domain(
 
     # Serialize complex data as JSON
     json_converter = WorkflowRuntimeTypeConverter()
-    node_execution.inputs = json.dumps(json_converter.to_json_encodable(execution.inputs)) if execution.inputs else "{}"
+    node_execution.inputs = (
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.inputs)) if execution.inputs else "{}"
+    )
     node_execution.process_data = (
-        json.dumps(json_converter.to_json_encodable(execution.process_data)) if execution.process_data else "{}"
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.process_data))
+        if execution.process_data
+        else "{}"
     )
     node_execution.outputs = (
-        json.dumps(json_converter.to_json_encodable(execution.outputs)) if execution.outputs else "{}"
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.outputs)) if execution.outputs else "{}"
     )
     # Convert metadata enum keys to strings for JSON serialization
     if execution.metadata:
         metadata_for_json = {
             key.value if hasattr(key, "value") else str(key): value for key, value in execution.metadata.items()
         }
-        node_execution.execution_metadata = json.dumps(json_converter.to_json_encodable(metadata_for_json))
+        node_execution.execution_metadata = orjson_dumps_with_fallback(
+            json_converter.to_json_encodable(metadata_for_json)
+        )
     else:
         node_execution.execution_metadata = "{}"
 
@@ -148,19 +154,25 @@ def _update_node_execution_from_domain(
     """
     # Update serialized data
     json_converter = WorkflowRuntimeTypeConverter()
-    node_execution.inputs = json.dumps(json_converter.to_json_encodable(execution.inputs)) if execution.inputs else "{}"
+    node_execution.inputs = (
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.inputs)) if execution.inputs else "{}"
+    )
     node_execution.process_data = (
-        json.dumps(json_converter.to_json_encodable(execution.process_data)) if execution.process_data else "{}"
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.process_data))
+        if execution.process_data
+        else "{}"
     )
     node_execution.outputs = (
-        json.dumps(json_converter.to_json_encodable(execution.outputs)) if execution.outputs else "{}"
+        orjson_dumps_with_fallback(json_converter.to_json_encodable(execution.outputs)) if execution.outputs else "{}"
     )
     # Convert metadata enum keys to strings for JSON serialization
     if execution.metadata:
         metadata_for_json = {
             key.value if hasattr(key, "value") else str(key): value for key, value in execution.metadata.items()
         }
-        node_execution.execution_metadata = json.dumps(json_converter.to_json_encodable(metadata_for_json))
+        node_execution.execution_metadata = orjson_dumps_with_fallback(
+            json_converter.to_json_encodable(metadata_for_json)
+        )
     else:
         node_execution.execution_metadata = "{}"
 
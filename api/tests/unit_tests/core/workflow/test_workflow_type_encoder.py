@@ -0,0 +1,56 @@
+from decimal import Decimal
+from enum import StrEnum
+
+from core.variables.segments import IntegerSegment, NoneSegment, ObjectSegment, StringSegment
+from core.workflow.workflow_type_encoder import WorkflowRuntimeTypeConverter
+
+
+class _Color(StrEnum):
+    RED = "red"
+
+
+def test_to_json_encodable_none():
+    assert WorkflowRuntimeTypeConverter().to_json_encodable(None) is None
+
+
+def test_to_json_encodable_primitive_leaves_are_returned_unchanged():
+    value = {"str": "text", "int": 1, "float": 1.5, "bool": True, "none": None, "enum": _Color.RED}
+
+    result = WorkflowRuntimeTypeConverter().to_json_encodable(value)
+
+    assert result == value
+    assert result["enum"] is _Color.RED
+
+
+def test_to_json_encodable_converts_nested_values():
+    value = {
+        "decimal": Decimal("0.5"),
+        "segment": StringSegment(value="hello"),
+        "nested": {"items": [IntegerSegment(value=1), NoneSegment(), {"price": Decimal(2)}]},
+        "object": ObjectSegment(value={"key": StringSegment(value="value")}),
+    }
+
+    result = WorkflowRuntimeTypeConverter().to_json_encodable(value)
+
+    assert result == {
+        "decimal": 0.5,
+        "segment": "hello",
+        "nested": {"items": [1, None, {"price": 2.0}]},
+        "object": {"key": "value"},
+    }
+
+
+def test_to_json_encodable_converts_dict_and_list_subclasses():
+    class _Dict(dict):
+        pass
+
+    class _List(list):
+        pass
+
+    value = {"dict": _Dict(price=Decimal("1.5")), "list": _List([Decimal(2), StringSegment(value="x")])}
+
+    result = WorkflowRuntimeTypeConverter().to_json_encodable(value)
+
+    assert result == {"dict": {"price": 1.5}, "list": [2.0, "x"]}
+    assert type(result["dict"]) is dict
+    assert type(result["list"]) is list
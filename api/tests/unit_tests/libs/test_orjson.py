@@ -0,0 +1,44 @@
+import json
+
+import pytest
+
+from libs.orjson import orjson_dumps_with_fallback
+
+
+def test_orjson_dumps_with_fallback_compact_output():
+    assert orjson_dumps_with_fallback({"a": [1, 2.5, None, True], "b": "你好"}) == '{"a":[1,2.5,null,true],"b":"你好"}'
+
+
+def test_orjson_dumps_with_fallback_stringifies_non_str_keys():
+    assert orjson_dumps_with_fallback({1: "one", 2.5: "two"}) == '{"1":"one","2.5":"two"}'
+
+
+@pytest.mark.parametrize("value", [float("nan"), float("inf"), float("-inf")], ids=["nan", "inf", "-inf"])
+def test_orjson_dumps_with_fallback_encodes_non_finite_floats_as_null(value):
+    assert orjson_dumps_with_fallback({"x": value}) == '{"x":null}'
+
+
+def test_orjson_dumps_with_fallback_oversized_int():
+    result = orjson_dumps_with_fallback({"n": 2**70, "text": "你好"})
+
+    assert result == '{"n":1180591620717411303424,"text":"\\u4f60\\u597d"}'
+    assert json.loads(result) == {"n": 2**70, "text": "你好"}
+
+
+def test_orjson_dumps_with_fallback_oversized_int_with_non_finite_floats():
+    result = orjson_dumps_with_fallback({"n": 2**70, "nested": [float("nan"), {"inf": float("inf")}]})
+
+    assert result == '{"n":1180591620717411303424,"nested":[null,{"inf":null}]}'
+
+
+def test_orjson_dumps_with_fallback_oversized_int_with_non_str_keys():
+    assert orjson_dumps_with_fallback({1: 2**70}) == '{"1":1180591620717411303424}'
+
+
+def test_orjson_dumps_with_fallback_lone_surrogate():
+    result = orjson_dumps_with_fallback({"text": "\ud83d"})
+
+    assert result == '{"text":"\\ud83d"}'
+    # The result must be encodable so it can be bound to a database column.
+    result.encode("utf-8")
+    assert json.loads(result) == {"text": "\ud83d"}
@@ -39,6 +39,20 @@ def configure_mock_execution(mock_execution):
     return mock_execution
 
 
+def _build_execution(**kwargs) -> WorkflowNodeExecution:
+    """Build a WorkflowNodeExecution with fixed identity fields, overridden by `kwargs`."""
+    return WorkflowNodeExecution(
+        id="test-id",
+        workflow_id="test-workflow-id",
+        index=1,
+        node_id="test-node-id",
+        node_type=NodeType.CODE,
+        title="Test Node",
+        created_at=datetime.now(),
+        **kwargs,
+    )
+
+
 @pytest.fixture
 def session():
     """Create a mock SQLAlchemy session."""
@@ -287,3 +301,85 @@ def test_to_domain_model(repository):
     assert domain_model.metadata == metadata_dict
     assert domain_model.created_at == db_model.created_at
     assert domain_model.finished_at == db_model.finished_at
+
+
+def test_to_db_model_serializes_unicode_payloads(repository):
+    """Test to_db_model keeps unicode text as-is in the serialized JSON."""
+    domain_model = _build_execution(
+        inputs={"text": "你好, wörld"},
+        outputs={"result": "ok", "nested": {"values": [1, 2.5, None, True]}},
+        status=WorkflowNodeExecutionStatus.SUCCEEDED,
+    )
+
+    db_model = repository.to_db_model(domain_model)
+
+    assert "你好, wörld" in db_model.inputs
+    assert db_model.inputs_dict == {"text": "你好, wörld"}
+    assert db_model.process_data is None
+    assert db_model.outputs_dict == {"result": "ok", "nested": {"values": [1, 2.5, None, True]}}
+
+
+@pytest.mark.parametrize("payload", [None, {}], ids=["none", "empty_dict"])
+def test_to_db_model_skips_serialization_for_empty_payloads(repository, mocker: MockerFixture, payload):
+    """Test to_db_model stores empty inputs/outputs/metadata as NULL without converting or serializing them."""
+    module = "core.repositories.sqlalchemy_workflow_node_execution_repository"
+    to_json_encodable = mocker.patch(f"{module}.WorkflowRuntimeTypeConverter.to_json_encodable")
+    jsonable_encoder_mock = mocker.patch(f"{module}.jsonable_encoder")
+    dumps_json = mocker.patch(f"{module}.orjson_dumps_with_fallback")
+    domain_model = _build_execution(
+        inputs=payload,
+        process_data=payload,
+        outputs=payload,
+        metadata=payload,
+    )
+
+    db_model = repository.to_db_model(domain_model)
+
+    assert db_model.inputs is None
+    assert db_model.process_data is None
+    assert db_model.outputs is None
+    assert db_model.execution_metadata is None
+    to_json_encodable.assert_not_called()
+    jsonable_encoder_mock.assert_not_called()
+    dumps_json.assert_not_called()
+
+
+def test_to_db_model_serializes_non_str_keys(repository):
+    """Test to_db_model stringifies non-string keys like `json.dumps` does."""
+    db_model = repository.to_db_model(_build_execution(outputs={"nested": {1: "one", 2.5: "two"}}))
+
+    assert db_model.outputs_dict == {"nested": {"1": "one", "2.5": "two"}}
+
+
+def test_to_db_model_falls_back_to_json_for_oversized_int(repository):
+    """Test to_db_model keeps integers exceeding 64 bits, which orjson cannot encode."""
+    db_model = repository.to_db_model(_build_execution(inputs={"n": 2**70, "text": "你好"}))
+
+    assert db_model.inputs_dict == {"n": 2**70, "text": "你好"}
+    # The `json.dumps` fallback escapes non-ASCII text, matching the previous behaviour.
+    assert db_model.inputs == '{"n":1180591620717411303424,"text":"\\u4f60\\u597d"}'
+
+
+def test_to_db_model_escapes_lone_surrogates(repository):
+    """Test to_db_model stores strings with lone surrogates as valid, UTF-8 encodable JSON."""
+    db_model = repository.to_db_model(_build_execution(outputs={"text": "partial \ud83d"}))
+
+    assert db_model.outputs == '{"text":"partial \\ud83d"}'
+    db_model.outputs.encode("utf-8")
+    assert db_model.outputs_dict == {"text": "partial \ud83d"}
+
+
+def test_to_db_model_stores_non_finite_floats_as_null(repository):
+    """Test to_db_model stores `NaN` and `Infinity` as `null`, producing valid JSON."""
+    db_model = repository.to_db_model(_build_execution(outputs={"nan": float("nan"), "inf": float("inf")}))
+
+    assert db_model.outputs == '{"nan":null,"inf":null}'
+    assert db_model.outputs_dict == {"nan": None, "inf": None}
+
+
+def test_to_db_model_stores_non_finite_floats_as_null_on_fallback(repository):
+    """Test `NaN` is stored as `null` even when an oversized int forces the `json.dumps` fallback."""
+    db_model = repository.to_db_model(_build_execution(outputs={"n": 2**70, "nan": float("nan")}))
+
+    assert db_model.outputs == '{"n":1180591620717411303424,"nan":null}'
+    assert db_model.outputs_dict == {"n": 2**70, "nan": None}
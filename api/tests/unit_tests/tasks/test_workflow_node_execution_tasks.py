@@ -0,0 +1,64 @@
+from datetime import datetime
+
+from core.workflow.entities.workflow_node_execution import (
+    WorkflowNodeExecution,
+    WorkflowNodeExecutionMetadataKey,
+    WorkflowNodeExecutionStatus,
+)
+from core.workflow.nodes.enums import NodeType
+from models import CreatorUserRole, WorkflowNodeExecutionModel
+from models.workflow import WorkflowNodeExecutionTriggeredFrom
+from tasks.workflow_node_execution_tasks import _create_node_execution_from_domain, _update_node_execution_from_domain
+
+
+def _build_execution(**kwargs) -> WorkflowNodeExecution:
+    return WorkflowNodeExecution(
+        id="test-id",
+        workflow_id="test-workflow-id",
+        index=1,
+        node_id="test-node-id",
+        node_type=NodeType.CODE,
+        title="Test Node",
+        status=WorkflowNodeExecutionStatus.SUCCEEDED,
+        created_at=datetime.now(),
+        **kwargs,
+    )
+
+
+def test_create_node_execution_from_domain_serializes_payloads():
+    execution = _build_execution(
+        inputs={"text": "你好"},
+        outputs={"n": 2**70, "nan": float("nan")},
+        metadata={WorkflowNodeExecutionMetadataKey.TOTAL_TOKENS: 100},
+    )
+
+    node_execution = _create_node_execution_from_domain(
+        execution=execution,
+        tenant_id="test-tenant-id",
+        app_id="test-app-id",
+        triggered_from=WorkflowNodeExecutionTriggeredFrom.WORKFLOW_RUN,
+        creator_user_id="test-user-id",
+        creator_user_role=CreatorUserRole.ACCOUNT,
+    )
+
+    assert node_execution.inputs == '{"text":"你好"}'
+    assert node_execution.process_data == "{}"
+    assert node_execution.outputs == '{"n":1180591620717411303424,"nan":null}'
+    assert node_execution.execution_metadata_dict == {"total_tokens": 100}
+
+
+def test_update_node_execution_from_domain_serializes_payloads():
+    node_execution = WorkflowNodeExecutionModel()
+    execution = _build_execution(
+        inputs={"text": "partial \ud83d"},
+        process_data={"nested": {1: "one"}},
+        outputs=None,
+    )
+
+    _update_node_execution_from_domain(node_execution, execution)
+
+    assert node_execution.inputs == '{"text":"partial \\ud83d"}'
+    assert node_execution.process_data == '{"nested":{"1":"one"}}'
+    assert node_execution.outputs == "{}"
+    assert node_execution.execution_metadata == "{}"
+    assert node_execution.status == WorkflowNodeExecutionStatus.SUCCEEDED.value